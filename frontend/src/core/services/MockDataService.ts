@@ -1,6 +1,9 @@
 // Import data type interfaces from models for type definitions
 import { DataStructure, ExcelFile, ExcelTab, DataSeries, DataPoint } from '../models/DataTypes';
 
+// Define cache of generated date arrays keyed by range and frequency
+const dateRangeCache = new Map<string, string[]>();
+
 // Define helper function to generate date arrays for data series
 const generateDates = (
   // Define startDate parameter as Date for beginning of date range
@@ -10,6 +13,14 @@ const generateDates = (
   // Define frequency parameter with specific time interval options
   frequency: 'daily' | 'weekly' | 'monthly' | 'quarterly' | 'yearly'
 ): string[] => {
+  // Build cache key from range bounds and frequency
+  const cacheKey = `${startDate.getTime()}-${endDate.getTime()}-${frequency}`;
+  // Return cached dates since most series share the same range (arrays are read-only)
+  const cachedDates = dateRangeCache.get(cacheKey);
+  if (cachedDates) {
+    return cachedDates;
+  }
+
   // Initialize dates array to store generated date strings
   const dates: string[] = [];
   // Create current date variable starting from startDate
@@ -18,7 +29,7 @@ const generateDates = (
   // Loop while current date is less than or equal to endDate
   while (current <= endDate) {
     // Add current date to dates array as ISO string without time
-    dates.push(current.toISOString().split('T')[0]);
+    dates.push(current.toISOString().slice(0, 10));
     
     // Switch on frequency to determine date increment
     switch (frequency) {
@@ -45,6 +56,8 @@ const generateDates = (
     }
   }
   
+  // Store completed dates array for later series with the same range
+  dateRangeCache.set(cacheKey, dates);
   // Return completed dates array
   return dates;
 };
@@ -416,43 +429,76 @@ export const createMockDataStructure = (): DataStructure => {
   return { files };
 };
 
+// Define module-level cache so the mock data structure is generated only once
+let mockDataStructure: DataStructure | null = null;
+
+// Define function returning the cached mock data structure, generating it on first use
+const getMockDataStructure = (): DataStructure => {
+  // Generate and store the structure if it has not been built yet
+  if (!mockDataStructure) {
+    mockDataStructure = createMockDataStructure();
+  }
+  // Return the shared mock data structure
+  return mockDataStructure;
+};
+
+// Define SeriesSearchEntry interface for flattened search index rows
+interface SeriesSearchEntry {
+  // Define series property for the matched data series
+  series: DataSeries;
+  // Define tab property as string for containing tab name
+  tab: string;
+  // Define file property as string for containing file name
+  file: string;
+  // Define name property as lowercased series name for matching
+  name: string;
+  // Define description property as lowercased description for matching
+  description: string;
+}
+
+// Define lazily built search index so queries skip the nested file → tab → series walk
+let seriesSearchIndex: SeriesSearchEntry[] | null = null;
+
+// Define function to flatten data structure into one search row per series
+const buildSeriesSearchIndex = (data: DataStructure): SeriesSearchEntry[] => {
+  // Initialize entries array to store flattened rows
+  const entries: SeriesSearchEntry[] = [];
+  // Iterate through files, tabs and series once to build the index
+  data.files.forEach(file => {
+    file.tabs.forEach(tab => {
+      tab.series.forEach(series => {
+        // Add series with context and precomputed lowercase search text
+        entries.push({
+          series,
+          tab: tab.name,
+          file: file.name,
+          name: series.name.toLowerCase(),
+          description: series.description?.toLowerCase() ?? ''
+        });
+      });
+    });
+  });
+  // Return completed entries array
+  return entries;
+};
+
 // Export mockDataService object providing data access methods
 export const mockDataService = {
-  // Define getData method returning complete mock data structure
-  getData: () => createMockDataStructure(),
+  // Define getData method returning the shared mock data structure
+  getData: () => getMockDataStructure(),
   // Define searchSeries method for finding series by query string
   searchSeries: (query: string): any[] => {
-    // Get complete data structure using createMockDataStructure function
-    const data = createMockDataStructure();
-    // Initialize results array to store matching series
-    const results: any[] = [];
+    // Build flattened search index on first search instead of regenerating data per query
+    if (!seriesSearchIndex) {
+      seriesSearchIndex = buildSeriesSearchIndex(getMockDataStructure());
+    }
     
     // Convert query to lowercase for case-insensitive search
     const searchTerm = query.toLowerCase();
     
-    // Iterate through files array to find matching series
-    data.files.forEach(file => {
-      // Iterate through tabs array within each file
-      file.tabs.forEach(tab => {
-        // Iterate through series array within each tab
-        tab.series.forEach(series => {
-          // Check if series name or description contains search term
-          if (
-            series.name.toLowerCase().includes(searchTerm) ||
-            series.description?.toLowerCase().includes(searchTerm)
-          ) {
-            // Add matching series with context to results array
-            results.push({
-              series,
-              tab: tab.name,
-              file: file.name
-            });
-          }
-        });
-      });
-    });
-    
-    // Return results array containing matching series
-    return results;
+    // Return matching series with file and tab context
+    return seriesSearchIndex
+      .filter(entry => entry.name.includes(searchTerm) || entry.description.includes(searchTerm))
+      .map(({ series, tab, file }) => ({ series, tab, file }));
   }
-}; 
\ No newline at end of file
+};
\ No newline at end of file
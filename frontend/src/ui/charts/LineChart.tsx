@@ -22,7 +22,8 @@ const LineChart: React.FC<LineChartProps> = ({
   dataSeries = EMPTY_DATA_SERIES,
   isDropTarget = false,
   gridSize = '3x3',
-  onDeleteSeries
+  onDeleteSeries,
+  useWebGL = false
 }) => {
   // --- 1. Refs ---
   const containerRef = useRef<HTMLDivElement>(null);
@@ -47,7 +48,8 @@ const LineChart: React.FC<LineChartProps> = ({
     seriesNames: state.seriesNames,
     settings: state.settings,
     seriesAxisAssignment: state.seriesAxisAssignment,
-    responsiveSettings: responsive.responsiveSettings
+    responsiveSettings: responsive.responsiveSettings,
+    useWebGL
   });
 
   const [showSettings, setShowSettings] = React.useState(false);
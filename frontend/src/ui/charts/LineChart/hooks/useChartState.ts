@@ -97,6 +97,22 @@ const processChartData = (state: ChartState): { processedData: DataPoint[]; proc
   }
 
   const responsiveSettings = getResponsiveSettings(state.gridSize);
+
+  // Fast path: a single series already in date order needs no date union, sort
+  // or alignment - its (sampled) points map straight onto chart rows
+  if (state.rawDataSeries.length === 1) {
+    const series = state.rawDataSeries[0];
+    const points = series.dataPoints;
+    const isAscending = points.every((dp, index) => index === 0 || points[index - 1].date < dp.date);
+    if (isAscending) {
+      const step = series.frequency === 'daily' ? responsiveSettings.sampleRate : 1;
+      const processedData: DataPoint[] = [];
+      for (let index = 0; index < points.length; index += step) {
+        processedData.push({ date: points[index].date, [series.id]: points[index].value });
+      }
+      return { processedData, processedSeries: buildProcessedSeries(state.rawDataSeries) };
+    }
+  }
   
   // Same logic as useChartData but pure function
   const dailySeries = state.rawDataSeries.filter(s => s.frequency === 'daily');
@@ -119,58 +135,82 @@ const processChartData = (state: ChartState): { processedData: DataPoint[]; proc
   });
   
   const sortedDates = Array.from(allDates).sort();
-  
+
+  // Index each series by date once so alignment is a single pass over the dates.
+  // The first point wins on repeated dates, matching a first-match lookup.
+  const seriesLookups = state.rawDataSeries.map(series => {
+    const valuesByDate = new Map<string, number>();
+    series.dataPoints.forEach((dp: any) => {
+      if (!valuesByDate.has(dp.date)) {
+        valuesByDate.set(dp.date, dp.value);
+      }
+    });
+    return { id: series.id, valuesByDate };
+  });
+
   const processedData = sortedDates.map(date => {
     const point: DataPoint = { date };
-    state.rawDataSeries.forEach(series => {
-      const dataPoint = series.dataPoints.find((dp: any) => dp.date === date);
-      if (dataPoint) {
-        point[series.id] = dataPoint.value;
+    seriesLookups.forEach(({ id, valuesByDate }) => {
+      const value = valuesByDate.get(date);
+      if (value !== undefined) {
+        point[id] = value;
       }
     });
     return point;
   });
 
-  const colors = ['#6366f1', '#f43f5e', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4'];
-  const processedSeries = state.rawDataSeries.map((series, index) => ({
+  return { processedData, processedSeries: buildProcessedSeries(state.rawDataSeries) };
+};
+
+const SERIES_COLORS = ['#6366f1', '#f43f5e', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4'];
+
+const buildProcessedSeries = (dataSeries: DataSeries[]): Series[] => {
+  return dataSeries.map((series, index) => ({
     id: series.id,
     name: series.name,
     dataKey: series.id,
-    color: colors[index % colors.length]
+    color: SERIES_COLORS[index % SERIES_COLORS.length]
   }));
+};
+
+// Static per-grid lookup tables, built once at module load
+const GRID_SAMPLE_SETTINGS: Record<string, { sampleRate: number }> = {
+  '1x1': { sampleRate: 2 },
+  '2x2': { sampleRate: 3 },
+  '3x3': { sampleRate: 5 },
+  '4x4': { sampleRate: 7 },
+  '5x5': { sampleRate: 10 }
+};
 
-  return { processedData, processedSeries };
+const GRID_LEGEND_HEIGHTS: Record<string, number> = {
+  '1x1': 36,
+  '2x2': 32,
+  '3x3': 28,
+  '4x4': 24,
+  '5x5': 20
 };
 
 const getResponsiveSettings = (gridSize: string) => {
-  const settings = {
-    '1x1': { sampleRate: 2 },
-    '2x2': { sampleRate: 3 },
-    '3x3': { sampleRate: 5 },
-    '4x4': { sampleRate: 7 },
-    '5x5': { sampleRate: 10 }
-  };
-  return settings[gridSize as keyof typeof settings] || settings['3x3'];
+  return GRID_SAMPLE_SETTINGS[gridSize] || GRID_SAMPLE_SETTINGS['3x3'];
 };
 
 const calculateLegendHeight = (state: ChartState): number => {
   if (!state.shouldShowLegend || state.processedSeries.length === 0) return 0;
   
-  const gridBasedHeights = {
-    '1x1': 36,
-    '2x2': 32,
-    '3x3': 28,
-    '4x4': 24,
-    '5x5': 20
-  };
-  
-  return gridBasedHeights[state.gridSize as keyof typeof gridBasedHeights] || 28;
+  return GRID_LEGEND_HEIGHTS[state.gridSize] || 28;
 };
 
 // Reducer function
 const chartReducer = (state: ChartState, action: ChartAction): ChartState => {
   switch (action.type) {
     case 'SET_RAW_DATA':
+      if (
+        state.rawData === action.payload.data &&
+        state.rawSeries === action.payload.series &&
+        state.rawDataSeries === action.payload.dataSeries
+      ) {
+        return state;
+      }
       return {
         ...state,
         rawData: action.payload.data,
@@ -179,6 +219,9 @@ const chartReducer = (state: ChartState, action: ChartAction): ChartState => {
       };
       
     case 'SET_GRID_SIZE':
+      if (state.gridSize === action.payload) {
+        return state;
+      }
       return {
         ...state,
         gridSize: action.payload,
@@ -207,6 +250,9 @@ const chartReducer = (state: ChartState, action: ChartAction): ChartState => {
       };
       
     case 'UPDATE_SERIES_NAME':
+      if (state.seriesNames[action.payload.seriesKey] === action.payload.name) {
+        return state;
+      }
       return {
         ...state,
         seriesNames: {
@@ -216,6 +262,9 @@ const chartReducer = (state: ChartState, action: ChartAction): ChartState => {
       };
       
     case 'SET_SERIES_AXIS':
+      if (state.seriesAxisAssignment[action.payload.seriesKey] === action.payload.axis) {
+        return state;
+      }
       return {
         ...state,
         seriesAxisAssignment: {
@@ -225,12 +274,18 @@ const chartReducer = (state: ChartState, action: ChartAction): ChartState => {
       };
       
     case 'SET_EDITING_SERIES':
+      if (state.editingSeries === action.payload) {
+        return state;
+      }
       return {
         ...state,
         editingSeries: action.payload
       };
       
     case 'SET_CAROUSEL_OFFSET':
+      if (state.carouselOffset === action.payload) {
+        return state;
+      }
       return {
         ...state,
         carouselOffset: action.payload
@@ -246,12 +301,18 @@ const chartReducer = (state: ChartState, action: ChartAction): ChartState => {
       };
       
     case 'SET_CHART_TITLE':
+      if (state.chartTitle === action.payload) {
+        return state;
+      }
       return {
         ...state,
         chartTitle: action.payload
       };
       
     case 'SET_EDITING_TITLE':
+      if (state.isEditingTitle === action.payload) {
+        return state;
+      }
       return {
         ...state,
         isEditingTitle: action.payload
@@ -304,13 +365,21 @@ const chartReducer = (state: ChartState, action: ChartAction): ChartState => {
       };
     }
     
-    case 'CALCULATE_LEGEND':
+    case 'CALCULATE_LEGEND': {
+      const legendHeight = calculateLegendHeight(state);
+      if (state.legendHeight === legendHeight) {
+        return state;
+      }
       return {
         ...state,
-        legendHeight: calculateLegendHeight(state)
+        legendHeight
       };
+    }
       
     case 'SET_MANIPULATION_MODAL':
+      if (state.showManipulationModal === action.payload) {
+        return state;
+      }
       return {
         ...state,
         showManipulationModal: action.payload
@@ -25,6 +25,8 @@ interface UsePlotlyConfigProps {
   settings: ChartSettings;
   seriesAxisAssignment: {[key: string]: 'y' | 'y2'};
   responsiveSettings: ResponsiveSettings;
+  // Allow WebGL (scattergl) traces for long series; SVG scatter otherwise
+  useWebGL?: boolean;
 }
 
 interface UsePlotlyConfigReturn {
@@ -35,32 +37,44 @@ interface UsePlotlyConfigReturn {
   hasRightAxisData: boolean;
 }
 
+// When WebGL is allowed, traces above this many points render through scattergl
+// instead of SVG
+const WEBGL_POINT_THRESHOLD = 2000;
+
+// Fallback trace palette, shared across renders instead of rebuilt per series
+const FALLBACK_TRACE_COLORS = ['#6366f1', '#f43f5e', '#10b981', '#f59e0b', '#8b5cf6'];
+
 export const usePlotlyConfig = ({
   processedData,
   processedSeries,
   seriesNames,
   settings,
   seriesAxisAssignment,
-  responsiveSettings
+  responsiveSettings,
+  useWebGL = false
 }: UsePlotlyConfigProps): UsePlotlyConfigReturn => {
 
   // Helper function to get the actual trace color for a series
   const getSeriesColor = (s: any, index: number) => {
-    return settings.colors[s.dataKey] || s.color || ['#6366f1', '#f43f5e', '#10b981', '#f59e0b', '#8b5cf6'][index % 5];
+    return settings.colors[s.dataKey] || s.color || FALLBACK_TRACE_COLORS[index % FALLBACK_TRACE_COLORS.length];
   };
 
   // Convert data to Plotly format
   const plotlyData = useMemo(() => {
     if (processedData.length === 0 || processedSeries.length === 0) return [];
 
+    // Every trace shares the same date axis, so build it once
+    const xData = processedData.map(d => d.date);
+    const traceType: 'scatter' | 'scattergl' =
+      useWebGL && processedData.length > WEBGL_POINT_THRESHOLD ? 'scattergl' : 'scatter';
+
     const traces = processedSeries.map((s, index) => {
-      const xData = processedData.map(d => d.date);
       const yData = processedData.map(d => d[s.dataKey] as number);
       
       const trace = {
         x: xData,
         y: yData,
-        type: 'scatter' as const,
+        type: traceType,
         mode: 'lines' as const,
         name: seriesNames[s.dataKey] || s.name,
         yaxis: seriesAxisAssignment[s.dataKey] || 'y',
@@ -120,7 +134,7 @@ export const usePlotlyConfig = ({
     }
     
     return traces;
-  }, [processedData, processedSeries, seriesNames, settings.colors, seriesAxisAssignment]);
+  }, [processedData, processedSeries, seriesNames, settings.colors, seriesAxisAssignment, useWebGL]);
 
   // Check which axes have data to ensure proper visibility (excluding invisible traces)
   const hasLeftAxisData = plotlyData.some(trace => 
@@ -137,6 +151,24 @@ export const usePlotlyConfig = ({
     plotlyDataCount: plotlyData.length
   });
 
+  // Collect per-axis value extents in a single pass so the margin and range
+  // calculations below don't each flatten and re-scan every trace
+  const axisExtents = useMemo(() => {
+    const extents = {
+      y: { min: Infinity, max: -Infinity },
+      y2: { min: Infinity, max: -Infinity }
+    };
+    plotlyData.forEach(trace => {
+      const extent = trace.yaxis === 'y2' ? extents.y2 : extents.y;
+      (trace.y || []).forEach((v: number) => {
+        if (v == null || isNaN(v)) return;
+        if (v < extent.min) extent.min = v;
+        if (v > extent.max) extent.max = v;
+      });
+    });
+    return extents;
+  }, [plotlyData]);
+
   // 🔧 DYNAMIC MARGINS: Calculate margins based on axis label widths
   const dynamicMargins = useMemo(() => {
     const font = `${responsiveSettings.fontSize}px Arial, sans-serif`;
@@ -150,11 +182,8 @@ export const usePlotlyConfig = ({
 
     // Calculate left margin
     if (hasLeftAxisData) {
-      const leftTraces = plotlyData.filter(t => !t.yaxis || t.yaxis === 'y');
-      const allLeftYValues = leftTraces.flatMap(t => t.y || []).filter(v => v !== null);
-      if (allLeftYValues.length > 0) {
-        const min = Math.min(...allLeftYValues);
-        const max = Math.max(...allLeftYValues);
+      const { min, max } = axisExtents.y;
+      if (min <= max) {
         // Find the value with the largest magnitude (absolute value) to estimate the widest label
         const widestLabelValue = Math.abs(min) > Math.abs(max) ? min : max;
         const widestLabelWidth = measureText(formatter.format(widestLabelValue), font);
@@ -164,11 +193,8 @@ export const usePlotlyConfig = ({
 
     // Calculate right margin
     if (hasRightAxisData) {
-      const rightTraces = plotlyData.filter(t => t.yaxis === 'y2');
-      const allRightYValues = rightTraces.flatMap(t => t.y || []).filter(v => v !== null);
-      if (allRightYValues.length > 0) {
-        const min = Math.min(...allRightYValues);
-        const max = Math.max(...allRightYValues);
+      const { min, max } = axisExtents.y2;
+      if (min <= max) {
         // Find the value with the largest magnitude (absolute value) to estimate the widest label
         const widestLabelValue = Math.abs(min) > Math.abs(max) ? min : max;
         const widestLabelWidth = measureText(formatter.format(widestLabelValue), font);
@@ -188,7 +214,7 @@ export const usePlotlyConfig = ({
     });
 
     return { l: finalMargin, r: finalMargin };
-  }, [plotlyData, hasLeftAxisData, hasRightAxisData, responsiveSettings.fontSize]);
+  }, [axisExtents, hasLeftAxisData, hasRightAxisData, responsiveSettings.fontSize]);
 
   // Calculate data range for right axis to sync gridlines when no left axis data
   const rightAxisDataRange = useMemo(() => {
@@ -197,20 +223,12 @@ export const usePlotlyConfig = ({
       return undefined;
     }
     
-    const rightAxisTraces = plotlyData.filter(trace => trace.yaxis === 'y2');
-    if (rightAxisTraces.length === 0) {
-      debug(debugCategories.PLOTLY_CONFIG, { message: 'Right axis range - no traces found' });
-      return undefined;
-    }
-    
-    const allYValues = rightAxisTraces.flatMap(trace => trace.y || []).filter(v => v != null && !isNaN(v));
-    if (allYValues.length === 0) {
+    const { min, max } = axisExtents.y2;
+    if (min > max) {
       debug(debugCategories.PLOTLY_CONFIG, { message: 'Right axis range - no valid Y values' });
       return undefined;
     }
     
-    const min = Math.min(...allYValues);
-    const max = Math.max(...allYValues);
     const padding = (max - min) * 0.1; // 10% padding
     const calculatedRange = [Math.max(0, min - padding), max + padding];
     
@@ -222,7 +240,7 @@ export const usePlotlyConfig = ({
     });
     
     return calculatedRange;
-  }, [plotlyData, hasLeftAxisData, hasRightAxisData]);
+  }, [axisExtents, hasLeftAxisData, hasRightAxisData]);
 
   // Plotly layout configuration with responsive settings
   const plotlyLayout = useMemo(() => {
@@ -27,6 +27,53 @@ interface ResponsiveData {
   isVerySmall: boolean;
 }
 
+// Trailing window (ms) used to coalesce container resize events
+const RESIZE_FLUSH_DELAY = 50;
+
+// Responsive settings per grid size (static, so built once at module load)
+const GRID_SETTINGS: Record<string, ResponsiveSettings> = {
+  '1x1': { 
+    fontSize: 14, 
+    titleSize: 16,
+    margin: { l: 60, r: 60, t: 40, b: 40 },
+    nticks: 8,
+    dateFormat: '%b-%Y',
+    sampleRate: 1
+  },
+  '2x2': { 
+    fontSize: 12, 
+    titleSize: 14,
+    margin: { l: 50, r: 50, t: 35, b: 35 },
+    nticks: 6,
+    dateFormat: '%b-%Y',
+    sampleRate: 2
+  },
+  '3x3': { 
+    fontSize: 11, 
+    titleSize: 13,
+    margin: { l: 45, r: 45, t: 30, b: 25 },
+    nticks: 4,
+    dateFormat: '%b-%Y',
+    sampleRate: 5
+  },
+  '4x4': { 
+    fontSize: 10, 
+    titleSize: 12,
+    margin: { l: 40, r: 40, t: 25, b: 25 },
+    nticks: 4,
+    dateFormat: '%b-%Y',
+    sampleRate: 10
+  },
+  '5x5': { 
+    fontSize: 9, 
+    titleSize: 11,
+    margin: { l: 35, r: 35, t: 20, b: 20 },
+    nticks: 3,
+    dateFormat: '%b-%Y',
+    sampleRate: 20
+  }
+};
+
 export const useSimpleResponsive = ({ 
   containerRef, 
   gridSize 
@@ -35,53 +82,12 @@ export const useSimpleResponsive = ({
   const [containerDimensions, setContainerDimensions] = useState({ width: 0, height: 0 });
   const [isDimensionsStable, setIsDimensionsStable] = useState(false);
   const stabilityTimer = useRef<NodeJS.Timeout | null>(null);
+  const resizeFlushTimer = useRef<NodeJS.Timeout | null>(null);
+  const pendingDimensions = useRef({ width: 0, height: 0 });
 
   // Responsive settings based on grid size only
   const responsiveSettings = useMemo((): ResponsiveSettings => {
-    const gridSettings = {
-      '1x1': { 
-        fontSize: 14, 
-        titleSize: 16,
-        margin: { l: 60, r: 60, t: 40, b: 40 },
-        nticks: 8,
-        dateFormat: '%b-%Y',
-        sampleRate: 1
-      },
-      '2x2': { 
-        fontSize: 12, 
-        titleSize: 14,
-        margin: { l: 50, r: 50, t: 35, b: 35 },
-        nticks: 6,
-        dateFormat: '%b-%Y',
-        sampleRate: 2
-      },
-      '3x3': { 
-        fontSize: 11, 
-        titleSize: 13,
-        margin: { l: 45, r: 45, t: 30, b: 25 },
-        nticks: 4,
-        dateFormat: '%b-%Y',
-        sampleRate: 5
-      },
-      '4x4': { 
-        fontSize: 10, 
-        titleSize: 12,
-        margin: { l: 40, r: 40, t: 25, b: 25 },
-        nticks: 4,
-        dateFormat: '%b-%Y',
-        sampleRate: 10
-      },
-      '5x5': { 
-        fontSize: 9, 
-        titleSize: 11,
-        margin: { l: 35, r: 35, t: 20, b: 20 },
-        nticks: 3,
-        dateFormat: '%b-%Y',
-        sampleRate: 20
-      }
-    };
-    
-    return gridSettings[gridSize as keyof typeof gridSettings] || gridSettings['3x3'];
+    return GRID_SETTINGS[gridSize] || GRID_SETTINGS['3x3'];
   }, [gridSize]);
 
   // Container dimension tracking
@@ -92,7 +98,16 @@ export const useSimpleResponsive = ({
       const entry = entries[0];
       if (entry) {
         const { width, height } = entry.contentRect;
-        setContainerDimensions({ width, height });
+        pendingDimensions.current = { width, height };
+
+        // Coalesce bursts of resize events into one dimension update (and one
+        // Plotly relayout) per flush window
+        if (!resizeFlushTimer.current) {
+          resizeFlushTimer.current = setTimeout(() => {
+            resizeFlushTimer.current = null;
+            setContainerDimensions(pendingDimensions.current);
+          }, RESIZE_FLUSH_DELAY);
+        }
         
         // Clear previous timer to prevent race conditions
         if (stabilityTimer.current) {
@@ -110,6 +125,10 @@ export const useSimpleResponsive = ({
     
     return () => {
       resizeObserver.disconnect();
+      if (resizeFlushTimer.current) {
+        clearTimeout(resizeFlushTimer.current);
+        resizeFlushTimer.current = null;
+      }
       if (stabilityTimer.current) {
         clearTimeout(stabilityTimer.current);
       }
@@ -20,6 +20,7 @@ export interface LineChartProps {
   dataSeries?: import('../../../../core/models/DataTypes').DataSeries[];
   isDropTarget?: boolean;
   gridSize?: string;
+  useWebGL?: boolean; // Opt in to WebGL traces for long series (default SVG)
 }
 
 // Export data manipulation types
@@ -7,12 +7,26 @@ export interface ValidationResult {
   detectedVariables: string[];
 }
 
+// Basic syntax checks, compiled once and shared across calls. No /g flag:
+// a global regex carries lastIndex between test() calls
+const SYNTAX_CHECKS = [
+  { pattern: /[^\w+\-*/().]/, message: "Invalid characters detected" },
+  { pattern: /[+\-*/]{2,}/, message: "Consecutive operators not allowed" },
+  { pattern: /[+\-*/]$/, message: "Formula cannot end with an operator" },
+  { pattern: /^[+*/]/, message: "Formula cannot start with *, /, or +" },
+];
+
+const VARIABLE_PATTERN = /[a-zA-Z_][a-zA-Z0-9_]*/g;
+
 // Simple formula validator - checks basic syntax and extracts variables
 export const validateFormula = (
   expression: string, 
   availableVariables: string[]
 ): ValidationResult => {
-  if (!expression.trim()) {
+  // Remove whitespace once; an empty result also covers blank input
+  const cleanExpression = expression.replace(/\s+/g, '');
+
+  if (!cleanExpression) {
     return {
       isValid: false,
       errorMessage: "Formula cannot be empty",
@@ -20,18 +34,8 @@ export const validateFormula = (
     };
   }
 
-  // Remove whitespace for processing
-  const cleanExpression = expression.replace(/\s+/g, '');
-
   // Check for basic syntax issues
-  const syntaxChecks = [
-    { pattern: /[^\w+\-*/().]/g, message: "Invalid characters detected" },
-    { pattern: /[+\-*/]{2,}/g, message: "Consecutive operators not allowed" },
-    { pattern: /[+\-*/]$/g, message: "Formula cannot end with an operator" },
-    { pattern: /^[+*/]/g, message: "Formula cannot start with *, /, or +" },
-  ];
-
-  for (const check of syntaxChecks) {
+  for (const check of SYNTAX_CHECKS) {
     if (check.pattern.test(cleanExpression)) {
       return {
         isValid: false,
@@ -64,12 +68,13 @@ export const validateFormula = (
   }
 
   // Extract variable names (sequences of word characters)
-  const variableMatches = cleanExpression.match(/[a-zA-Z_][a-zA-Z0-9_]*/g) || [];
+  const variableMatches = cleanExpression.match(VARIABLE_PATTERN) || [];
   const detectedVariables = Array.from(new Set(variableMatches)); // Remove duplicates
 
-  // Check if all variables are available
+  // Check if all variables are available (Set lookup instead of a scan per variable)
+  const availableSet = new Set(availableVariables);
   const unavailableVars = detectedVariables.filter(
-    variable => !availableVariables.includes(variable)
+    variable => !availableSet.has(variable)
   );
 
   if (unavailableVars.length > 0) {
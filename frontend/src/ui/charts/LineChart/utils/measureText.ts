@@ -8,12 +8,16 @@
 interface MeasureText {
   (text: string, font: string): number;
   canvas?: HTMLCanvasElement;
+  context?: CanvasRenderingContext2D | null;
 }
 
 export const measureText: MeasureText = (text: string, font: string): number => {
-  // Re-use the same canvas element to avoid creating new ones unnecessarily.
-  const canvas = measureText.canvas || (measureText.canvas = document.createElement('canvas'));
-  const context = canvas.getContext('2d');
+  // Re-use the same canvas element and 2D context to avoid looking them up on every call.
+  if (measureText.context === undefined) {
+    const canvas = measureText.canvas || (measureText.canvas = document.createElement('canvas'));
+    measureText.context = canvas.getContext('2d');
+  }
+  const context = measureText.context;
   
   if (!context) {
     // Fallback if canvas is not supported, though it's unlikely in modern browsers.
@@ -40,4 +44,5 @@ declare global {
   }
 }
 
-measureText.canvas = undefined; 
\ No newline at end of file
+measureText.canvas = undefined;
+measureText.context = undefined; 
\ No newline at end of file
@@ -9,6 +9,10 @@ import { GridSize } from './Header';
 // Import DataSeries interface from core models
 import { DataSeries } from '../../core/models/DataTypes';
 
+// Define maximum mounted charts that may use WebGL; each WebGL chart holds its own
+// GL context and browsers drop the oldest beyond ~16, blanking those charts
+const WEBGL_CHART_BUDGET = 8;
+
 // Define Chart interface for chart data structure
 export interface Chart {
   // Define id property as string for chart identification
@@ -187,6 +191,10 @@ const ChartCanvas: React.FC<ChartCanvasProps> = ({
     }
   };
 
+  // Every chart in the library is mounted (the grid scrolls), so allow WebGL
+  // only while the mounted chart count stays within the context budget
+  const allowWebGL = charts.length <= WEBGL_CHART_BUDGET;
+
   const renderChart = (chart: Chart) => {
     const isDropTarget = dragOverChart === chart.id;
     
@@ -201,6 +209,7 @@ const ChartCanvas: React.FC<ChartCanvasProps> = ({
             dataSeries={chart.dataSeries}
             isDropTarget={isDropTarget}
             gridSize={gridSize}
+            useWebGL={allowWebGL}
           />
         );
 